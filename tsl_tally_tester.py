@@ -11,9 +11,10 @@ Website: https://www.freshavlabs.com
 License: MIT
 """
 
+import errno
 import json
 import socket
-import threading
+import struct
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -22,6 +23,10 @@ import os
 import sys
 import random
 
+if sys.platform.startswith('linux'):
+    import ctypes
+    import ctypes.util
+
 APP_NAME = "TSL Tally Tester"
 APP_VERSION = "1.0.0"
 CONFIG_FILE = "tsl_tester_config.json"
@@ -49,36 +54,189 @@ C = {
 }
 
 
+# Tally state -> (color, button text)
+STATES = {
+    'off': (C['off'], 'OFF'),
+    'pgm': (C['pgm'], 'PGM'),
+    'pvw': (C['pvw'], 'PVW'),
+    'both': (C['both'], 'BOTH')
+}
+# TSL 3.1 control byte for each state, and back
+CTRL = {'off': 0x00, 'pgm': 0x01, 'pvw': 0x02, 'both': 0x03}
+NAMES = ['off', 'pgm', 'pvw', 'both']
+
+NUM_INPUTS = 80
+PKT_LEN = 18
+# Header, address, control, reserved, 14 char label
+_TSL_STRUCT = struct.Struct('<BBBB14s')
+# Full NIC/driver queue, worth one short back off before giving up
+_ENOBUFS = {errno.ENOBUFS, getattr(errno, 'WSAENOBUFS', errno.ENOBUFS)}
+
+
 class TSL31:
     """TSL 3.1 Protocol"""
     
     @staticmethod
     def packet(addr: int, pgm: bool, pvw: bool, label: str = "") -> bytes:
         ctrl = (0x01 if pgm else 0) | (0x02 if pvw else 0)
-        lbl = label[:14].ljust(14).encode('ascii', errors='replace')
-        return bytes([0x80, max(0, addr - 1), ctrl, 0x00]) + lbl
+        return _TSL_STRUCT.pack(0x80, max(0, addr - 1), ctrl, 0x00, TSL31.encode_label(label))
     
     @staticmethod
-    def send(ip: str, port: int, pkt: bytes) -> bool:
+    def encode_label(label: str) -> bytes:
+        return label[:14].ljust(14).encode('ascii', errors='replace')
+    
+    @staticmethod
+    def send(sock: socket.socket, addr: tuple, pkt: bytes) -> bool:
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(0.3)
-            s.sendto(pkt, (ip, port))
-            s.close()
+            sock.sendto(pkt, addr)
             return True
-        except:
-            return False
+        except OSError:
+            return False  # Includes BlockingIOError on a full send buffer
+    
+    @staticmethod
+    def send_batch(sock: socket.socket, addr: tuple, pkts: list) -> int:
+        """Send many packets in one go, returns the number sent"""
+        if not pkts:
+            return 0
+        if _sendmmsg is not None:
+            try:
+                return _sendmmsg(sock, addr, pkts)
+            except BlockingIOError:
+                return 0  # Send buffer full, the caller counts these as errors
+            except (OSError, ValueError):
+                pass  # Hostname or unsupported address, use the loop
+        sent = 0
+        retried = False
+        while sent < len(pkts):
+            try:
+                sock.sendto(pkts[sent], addr)
+            except OSError as e:
+                if e.errno not in _ENOBUFS or retried:
+                    break
+                retried = True
+                time.sleep(0.001)
+                continue
+            sent += 1
+        return sent
+    
+    @staticmethod
+    def send_frame(sock: socket.socket, addr: tuple, buf: bytearray, pkt_len: int) -> int:
+        """Send a buffer of back to back fixed-size packets, returns the number sent"""
+        if _sendmmsg_buf is not None:
+            try:
+                return _sendmmsg_buf(sock, addr, buf, pkt_len)
+            except BlockingIOError:
+                return 0
+            except (OSError, ValueError):
+                pass
+        mv = memoryview(buf)
+        return TSL31.send_batch(sock, addr, [mv[i:i + pkt_len] for i in range(0, len(buf), pkt_len)])
+
+
+_sendmmsg = None
+_sendmmsg_buf = None
+
+if sys.platform.startswith('linux'):
+    class _iovec(ctypes.Structure):
+        _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+    
+    class _msghdr(ctypes.Structure):
+        _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                    ('msg_iov', ctypes.POINTER(_iovec)), ('msg_iovlen', ctypes.c_size_t),
+                    ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                    ('msg_flags', ctypes.c_int)]
+    
+    class _mmsghdr(ctypes.Structure):
+        _fields_ = [('msg_hdr', _msghdr), ('msg_len', ctypes.c_uint)]
+    
+    class _sockaddr_in(ctypes.Structure):
+        _fields_ = [('sin_family', ctypes.c_ushort), ('sin_port', ctypes.c_uint16),
+                    ('sin_addr', ctypes.c_ubyte * 4), ('sin_zero', ctypes.c_ubyte * 8)]
+    
+    def _mmsg_vector(base, lens, sa):
+        """Build the iovec and mmsghdr arrays for packets laid out from base"""
+        n = len(lens)
+        iov = (_iovec * n)()
+        msgs = (_mmsghdr * n)()
+        off = 0
+        for i, ln in enumerate(lens):
+            iov[i].iov_base = base + off
+            iov[i].iov_len = ln
+            off += ln
+            h = msgs[i].msg_hdr
+            h.msg_name = ctypes.addressof(sa)
+            h.msg_namelen = ctypes.sizeof(sa)
+            h.msg_iov = ctypes.pointer(iov[i])
+            h.msg_iovlen = 1
+        return iov, msgs
+    
+    def _set_dest(sa, addr):
+        sa.sin_family = socket.AF_INET
+        sa.sin_port = socket.htons(addr[1])
+        sa.sin_addr[:] = socket.inet_aton(addr[0])
+    
+    def _sendmmsg_vec(sock, msgs, n):
+        sent = 0
+        retried = False
+        while sent < n:
+            r = _libc.sendmmsg(sock.fileno(), ctypes.byref(msgs, sent * ctypes.sizeof(_mmsghdr)),
+                               n - sent, 0)
+            if r < 0:
+                err = ctypes.get_errno()
+                if err in _ENOBUFS and not retried:
+                    retried = True
+                    time.sleep(0.001)
+                    continue
+                if sent:
+                    break
+                raise OSError(err, os.strerror(err))
+            sent += r
+        return sent
+    
+    def _sendmmsg_linux(sock, addr, pkts):
+        """sendmmsg(2) wrapper - one syscall for the whole batch"""
+        sa = _sockaddr_in()
+        _set_dest(sa, addr)
+        buf = ctypes.create_string_buffer(b''.join(pkts))
+        iov, msgs = _mmsg_vector(ctypes.addressof(buf), [len(p) for p in pkts], sa)
+        return _sendmmsg_vec(sock, msgs, len(pkts))
+    
+    # Prebuilt message vectors for frame buffers, keyed by (id(buf), pkt_len)
+    _frames = {}
+    
+    def _sendmmsg_frame(sock, addr, buf, pkt_len):
+        """sendmmsg(2) straight out of a bytearray of fixed-size packets"""
+        key = (id(buf), pkt_len)
+        if key not in _frames:
+            cbuf = (ctypes.c_char * len(buf)).from_buffer(buf)  # Also keeps buf alive
+            sa = _sockaddr_in()
+            iov, msgs = _mmsg_vector(ctypes.addressof(cbuf), [pkt_len] * (len(buf) // pkt_len), sa)
+            _frames[key] = (cbuf, sa, iov, msgs)
+        cbuf, sa, iov, msgs = _frames[key]
+        _set_dest(sa, addr)
+        return _sendmmsg_vec(sock, msgs, len(msgs))
+    
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if hasattr(_libc, 'sendmmsg'):
+            _sendmmsg = _sendmmsg_linux
+            _sendmmsg_buf = _sendmmsg_frame
+    except OSError:
+        pass
 
 
 class TallyRow(tk.Frame):
     """Single input row"""
     
-    def __init__(self, parent, num, callback):
+    def __init__(self, parent, num, callback, pkt, label=""):
         super().__init__(parent, bg=C['card'], pady=6, padx=10)
         self.num = num
         self.callback = callback
         self.state = 'off'
         
+        # This row's 18 bytes of the app's packet frame
+        self.pkt = pkt
+        
         # Number
         tk.Label(self, text=f"{num:2d}", font=('Consolas', 12, 'bold'),
                 bg=C['card'], fg=C['muted'], width=3).pack(side='left')
@@ -106,34 +264,39 @@ class TallyRow(tk.Frame):
             b.pack(side='left', padx=1)
         
         # Label
-        self.label = tk.StringVar(value=f"CAM {num}")
+        self.label = tk.StringVar(value=label)
+        self.label.trace_add('write', self._recode)
+        self._recode()
         e = tk.Entry(self, textvariable=self.label, width=14, font=('Segoe UI', 10),
                     bg=C['bg3'], fg=C['text'], relief='flat', insertbackground=C['text'],
                     highlightthickness=1, highlightbackground=C['border'], highlightcolor=C['accent'])
         e.pack(side='left', padx=10, ipady=3)
         e.bind('<Return>', lambda e: self._send())
+        
+        # Pick up any state set before this row was built
+        self.set_state(NAMES[pkt[2]], send=False)
     
     def _cycle(self):
         states = ['off', 'pgm', 'pvw', 'both']
         self.set_state(states[(states.index(self.state) + 1) % 4])
     
-    def set_state(self, st, send=True):
-        self.state = st
-        cfg = {
-            'off': (C['off'], 'OFF'),
-            'pgm': (C['pgm'], 'PGM'),
-            'pvw': (C['pvw'], 'PVW'),
-            'both': (C['both'], 'BOTH')
-        }
-        col, txt = cfg[st]
-        self.btn.config(bg=col, text=txt, activebackground=col)
-        self.ind.config(bg=col)
+    def set_state(self, st, send=True, force=False):
+        if st != self.state or force:
+            self.state = st
+            col, txt = STATES[st]
+            self.btn.config(bg=col, text=txt, activebackground=col)
+            self.ind.config(bg=col)
+            self.pkt[2] = CTRL[st]
         if send:
             self._send()
     
+    def _recode(self, *args):
+        """Re-encode the label into the packet whenever the text changes"""
+        self._label_bytes = TSL31.encode_label(self.label.get())
+        self.pkt[4:18] = self._label_bytes
+    
     def _send(self):
-        self.callback(self.num, self.state in ('pgm', 'both'), 
-                     self.state in ('pvw', 'both'), self.label.get())
+        self.callback(self.pkt)
     
     def get_label(self):
         return self.label.get()
@@ -152,16 +315,54 @@ class App:
         
         self.ip = tk.StringVar(value="192.168.1.100")
         self.port = tk.StringVar(value="5727")
+        self._dest = ('192.168.1.100', 5727)  # Parsed (ip, port), None if invalid
+        self.ip.trace_add('write', self._refresh_dest)
+        self.port.trace_add('write', self._refresh_dest)
         self.inputs = {}
+        
+        # Packet frame for all inputs, laid out back to back. Byte 2 of each
+        # packet is the tally state, so self.pkts[2::PKT_LEN] is the state array.
+        self.pkts = bytearray(NUM_INPUTS * PKT_LEN)
+        for i in range(NUM_INPUTS):
+            _TSL_STRUCT.pack_into(self.pkts, i*PKT_LEN, 0x80, i, 0x00, 0x00, b' ' * 14)
+        mv = memoryview(self.pkts)
+        self.views = [mv[i*PKT_LEN:(i+1)*PKT_LEN] for i in range(NUM_INPUTS)]
+        self.cur_page = None
         self.packets = 0
         self.errors = 0
         self.running = {'demo': False, 'chase': False}
+        self._after = {'demo': None, 'chase': None}  # Pending pattern steps
+        self._chase_cur = 1
+        self._prev_pgm = None  # Last inputs picked by Random
+        self._prev_pvw = None
+        self._flash_pending = False
+        self._last_flash_color = None
+        self._scroll_dirty = False
         self.enabled = False  # Start/stop state
         
+        # Persistent socket shared by all sends
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind(('', 0))
+        # Room for full-board bursts, the OS may clamp this so keep what we got
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        except OSError:
+            pass
+        self.sndbuf = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        self.replies = 0
+        
         self._load_cfg()
         self._build()
         self._make_inputs()
         self._page(0)
+        
+        # Watch the socket for replies from the receiver on the Tk event loop.
+        # Windows Tk has no file handlers, poll there instead.
+        if hasattr(self.root.tk, 'createfilehandler'):
+            self.root.tk.createfilehandler(self.sock.fileno(), tk.READABLE, self._on_udp_ready)
+        else:
+            self._poll_udp()
     
     def _build(self):
         # Header
@@ -272,9 +473,11 @@ class App:
         self.canvas.pack(side='left', fill='both', expand=True)
         
         self.win = self.canvas.create_window((0,0), window=self.frame, anchor='nw')
-        self.frame.bind('<Configure>', lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
+        self.frame.bind('<Configure>', self._scroll_changed)
         self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.win, width=e.width))
-        self.canvas.bind_all('<MouseWheel>', lambda e: self.canvas.yview_scroll(int(-e.delta/120), 'units'))
+        # Only grab the wheel while the pointer is over the inputs
+        self.canvas.bind('<Enter>', lambda e: self.canvas.bind_all('<MouseWheel>', self._on_wheel))
+        self.canvas.bind('<Leave>', self._wheel_leave)
         
         # Footer
         ft = tk.Frame(self.root, bg=C['bg2'], pady=6)
@@ -293,26 +496,66 @@ class App:
         tk.Label(ft, text=f"v{APP_VERSION}", font=('Segoe UI', 9),
                 bg=C['bg2'], fg=C['muted']).pack(side='right', padx=10)
     
+    def _scroll_changed(self, e=None):
+        # Coalesce a burst of <Configure> events into one bbox on idle
+        if not self._scroll_dirty:
+            self._scroll_dirty = True
+            self.root.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        self._scroll_dirty = False
+        self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+    
+    def _wheel_leave(self, e):
+        # The canvas also gets <Leave> when the pointer moves onto a row inside it
+        w = self.canvas.winfo_containing(e.x_root, e.y_root)
+        if w is None or not str(w).startswith(str(self.canvas)):
+            self.canvas.unbind_all('<MouseWheel>')
+    
+    def _on_wheel(self, e):
+        self.canvas.yview_scroll(int(-e.delta/120), 'units')
+    
     def _make_inputs(self):
-        for i in range(1, 81):
-            self.inputs[i] = TallyRow(self.frame, i, self._send)
-        
-        # Apply loaded labels
-        if hasattr(self, '_labels'):
-            for k, v in self._labels.items():
-                if int(k) in self.inputs:
-                    self.inputs[int(k)].set_label(v)
+        # One frame per page so switching pages only packs/unpacks the frame
+        self.page_frames = [tk.Frame(self.frame, bg=C['bg']) for _ in range(5)]
+        
+        # Rows are built when their page is first shown. Until then the label
+        # is kept here and the state only lives in the packet frame.
+        self.labels = {i: f"CAM {i}" for i in range(1, NUM_INPUTS + 1)}
+        for k, v in getattr(self, '_labels', {}).items():
+            if int(k) in self.labels:
+                self.labels[int(k)] = v
+        for i, v in self.labels.items():
+            self.views[i - 1][4:] = TSL31.encode_label(v)
+    
+    def _build_page(self, p):
+        for i in range(p*16+1, min((p+1)*16, NUM_INPUTS) + 1):
+            w = TallyRow(self.page_frames[p], i, self._send, self.views[i - 1], self.labels.pop(i))
+            w.pack(fill='x', pady=2)
+            self.inputs[i] = w
+    
+    def _get_label(self, i):
+        w = self.inputs.get(i)
+        return w.get_label() if w is not None else self.labels[i]
+    
+    def _set_label(self, i, v):
+        w = self.inputs.get(i)
+        if w is not None:
+            w.set_label(v)
+        else:
+            self.labels[i] = v
+            self.views[i - 1][4:] = TSL31.encode_label(v)
     
     def _page(self, p):
-        self.cur_page = p
         for i, b in enumerate(self.pages):
             b.config(bg=C['accent'] if i == p else C['off'])
         
-        for w in self.inputs.values():
-            w.pack_forget()
-        
-        for i in range(p*16+1, min((p+1)*16+1, 81)):
-            self.inputs[i].pack(fill='x', pady=2)
+        if self.inputs.get(p*16+1) is None:
+            self._build_page(p)
+        if self.cur_page is not None:
+            self.page_frames[self.cur_page].pack_forget()
+        self.page_frames[p].pack(fill='both', expand=True)
+        self.cur_page = p
         
         self.canvas.yview_moveto(0)
     
@@ -327,95 +570,195 @@ class App:
             self.dot.config(fg=C['muted'])
             self.status_lbl.config(text="Stopped", fg=C['muted'])
             # Stop any running demos/chases
-            self.running['demo'] = False
-            self.running['chase'] = False
+            for mode in ('demo', 'chase'):
+                if self.running[mode]:
+                    self._stop(mode)
     
-    def _send(self, num, pgm, pvw, label):
+    def _refresh_dest(self, *args):
+        try:
+            port = int(self.port.get())
+        except ValueError:
+            port = 0
+        self._dest = (self.ip.get(), port) if 0 < port < 65536 else None
+    
+    def _send(self, pkt):
         if not self.enabled:
             return
         try:
-            pkt = TSL31.packet(num, pgm, pvw, label)
-            if TSL31.send(self.ip.get(), int(self.port.get()), pkt):
+            if self._dest is not None and TSL31.send(self.sock, self._dest, pkt):
                 self.packets += 1
                 self._flash(C['success'])
             else:
                 self.errors += 1
                 self._flash(C['error'])
-        except:
+        except (OSError, ValueError):
             self.errors += 1
             self._flash(C['error'])
         self._stats()
     
+    def _send_batch(self, pkts):
+        if not self.enabled or not pkts:
+            return
+        if self._dest is not None:
+            sent = TSL31.send_batch(self.sock, self._dest, pkts)
+        else:
+            sent = 0
+        self._count(sent, len(pkts))
+    
+    def _send_all(self):
+        """Send every input's packet straight from the frame buffer"""
+        if not self.enabled:
+            return
+        if self._dest is not None:
+            sent = TSL31.send_frame(self.sock, self._dest, self.pkts, PKT_LEN)
+        else:
+            sent = 0
+        self._count(sent, NUM_INPUTS)
+    
+    def _count(self, sent, total):
+        self.packets += sent
+        self.errors += total - sent
+        self._flash(C['success'] if sent == total else C['error'])
+        self._stats()
+    
     def _flash(self, c):
+        # One reset timer per flash, repeated sends only recolor on change
+        if self._flash_pending:
+            if c != self._last_flash_color:
+                self._last_flash_color = c
+                self.dot.config(fg=c)
+            return
+        self._flash_pending = True
+        self._last_flash_color = c
         self.dot.config(fg=c)
-        self.root.after(100, lambda: self.dot.config(fg=C['muted']))
+        self.root.after(100, self._flash_reset)
+    
+    def _flash_reset(self):
+        self._flash_pending = False
+        self.dot.config(fg=C['muted'])
+    
+    def _on_udp_ready(self, fd=None, mask=None):
+        # Drain everything queued so a burst costs one Tk event
+        n = 0
+        while True:
+            try:
+                self.sock.recvfrom(2048)
+            except OSError:
+                break  # BlockingIOError once empty
+            n += 1
+        if n:
+            self.replies += n
+            self._stats()
+    
+    def _poll_udp(self):
+        self._on_udp_ready()
+        self.root.after(250, self._poll_udp)
     
     def _stats(self):
-        self.pkt_lbl.config(text=f"{self.packets} sent")
+        rx = f", {self.replies} rx" if self.replies else ""
+        self.pkt_lbl.config(text=f"{self.packets} sent{rx}")
+    
+    def _frame(self):
+        """Copy of the current state byte of every input"""
+        return bytearray(self.pkts[2::PKT_LEN])
+    
+    def _apply_frame(self, frame):
+        """Write a whole frame of states, then redraw and send only what changed"""
+        prev = self.pkts[2::PKT_LEN]
+        self.pkts[2::PKT_LEN] = frame
+        changed = [i for i, (a, b) in enumerate(zip(prev, frame)) if a != b]
+        for i in changed:
+            w = self.inputs.get(i + 1)
+            if w is not None:
+                w.set_state(NAMES[frame[i]], send=False)
+        self._send_batch([self.views[i] for i in changed])
+    
+    def _apply_changes(self, changes):
+        """Set a few inputs by index, redraw and send only those that changed"""
+        rows = []
+        for i, c in changes.items():
+            if self.pkts[i*PKT_LEN + 2] != c:
+                self.pkts[i*PKT_LEN + 2] = c
+                w = self.inputs.get(i + 1)
+                if w is not None:
+                    w.set_state(NAMES[c], send=False)
+                rows.append(self.views[i])
+        self._send_batch(rows)
     
     def _all_off(self):
+        self.pkts[2::PKT_LEN] = bytes(NUM_INPUTS)
         for w in self.inputs.values():
-            w.set_state('off')
-            time.sleep(0.003)
+            w.set_state('off', send=False)
+        self._send_all()
+        self.root.update_idletasks()
     
     def _send_labels(self):
-        for w in self.inputs.values():
-            w._send()
-            time.sleep(0.003)
+        self._send_all()
     
     def _toggle(self, mode):
         if self.running[mode]:
-            self.running[mode] = False
-            self.action_btns[mode].config(bg=C['off'], text=mode.title())
+            self._stop(mode)
         else:
             if not self.enabled:
                 return  # Don't start if not enabled
             self.running[mode] = True
             self.action_btns[mode].config(bg=C['accent'], text=f"{mode.title()} ON")
-            threading.Thread(target=self._demo if mode == 'demo' else self._chase, daemon=True).start()
+            if mode == 'demo':
+                self._demo_step(1)
+            else:
+                self._chase_step(1)
     
-    def _demo(self):
-        while self.running['demo']:
-            for i in range(1, 9):
-                if not self.running['demo']:
-                    break
-                for j in range(1, 9):
-                    self.inputs[j].set_state('off')
-                self.inputs[i].set_state('pgm')
-                self.inputs[(i % 8) + 1].set_state('pvw')
-                time.sleep(0.7)
-        for j in range(1, 9):
-            self.inputs[j].set_state('off')
-        self.action_btns['demo'].config(bg=C['off'], text='Demo')
-    
-    def _chase(self):
-        while self.running['chase']:
-            for i in range(1, 81):
-                if not self.running['chase']:
-                    break
-                self.inputs[i].set_state('pgm')
-                time.sleep(1.0)
-                self.inputs[i].set_state('off')
-        self.action_btns['chase'].config(bg=C['off'], text='Chase')
+    def _stop(self, mode):
+        self.running[mode] = False
+        if self._after[mode] is not None:
+            self.root.after_cancel(self._after[mode])
+            self._after[mode] = None
+        frame = self._frame()
+        if mode == 'demo':
+            frame[0:8] = bytes(8)
+        else:
+            frame[self._chase_cur - 1] = CTRL['off']
+        self._apply_frame(frame)
+        self.action_btns[mode].config(bg=C['off'], text=mode.title())
+    
+    def _demo_step(self, i):
+        """One frame of the demo: PGM on i, PVW on the next of inputs 1-8"""
+        frame = self._frame()
+        frame[0:8] = bytes(8)
+        frame[i - 1] = CTRL['pgm']
+        frame[i % 8] = CTRL['pvw']
+        self._apply_frame(frame)
+        self._after['demo'] = self.root.after(700, self._demo_step, (i % 8) + 1)
+    
+    def _chase_step(self, i):
+        """Move PGM from the previous input to input i"""
+        frame = self._frame()
+        frame[self._chase_cur - 1] = CTRL['off']
+        frame[i - 1] = CTRL['pgm']
+        self._chase_cur = i
+        self._apply_frame(frame)
+        self._after['chase'] = self.root.after(1000, self._chase_step, (i % NUM_INPUTS) + 1)
     
     def _random(self):
-        for w in self.inputs.values():
-            w.set_state('off', send=False)
-        p, v = random.sample(range(1, 81), 2)
-        self.inputs[p].set_state('pgm')
-        self.inputs[v].set_state('pvw')
+        # Only the last random pair needs clearing, not the whole board
+        changes = {i: CTRL['off'] for i in (self._prev_pgm, self._prev_pvw) if i is not None}
+        p, v = random.sample(range(NUM_INPUTS), 2)
+        changes[p] = CTRL['pgm']
+        changes[v] = CTRL['pvw']
+        self._prev_pgm, self._prev_pvw = p, v
+        self._apply_changes(changes)
     
     def _preset(self):
         pr = self.preset.get()
-        for i, w in self.inputs.items():
+        for i in range(1, NUM_INPUTS + 1):
             if pr == "Clear":
-                w.set_label("")
+                self._set_label(i, "")
             else:
-                w.set_label(pr.replace("#", str(i)))
+                self._set_label(i, pr.replace("#", str(i)))
     
     def _save(self):
         cfg = {'ip': self.ip.get(), 'port': self.port.get(),
-               'labels': {str(i): w.get_label() for i, w in self.inputs.items()}}
+               'labels': {str(i): self._get_label(i) for i in range(1, NUM_INPUTS + 1)}}
         p = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('JSON', '*.json')])
         if p:
             with open(p, 'w') as f:
@@ -429,7 +772,7 @@ class App:
                 self.ip.set(cfg.get('ip', '192.168.1.100'))
                 self.port.set(cfg.get('port', '5727'))
                 self._labels = cfg.get('labels', {})
-        except:
+        except (OSError, json.JSONDecodeError, ValueError):
             self._labels = {}
     
     def _load_dlg(self):
@@ -440,8 +783,8 @@ class App:
             self.ip.set(cfg.get('ip', self.ip.get()))
             self.port.set(cfg.get('port', self.port.get()))
             for k, v in cfg.get('labels', {}).items():
-                if int(k) in self.inputs:
-                    self.inputs[int(k)].set_label(v)
+                if 1 <= int(k) <= NUM_INPUTS:
+                    self._set_label(int(k), v)
 
 
 def main():